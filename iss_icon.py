@@ -1,2 +1,8 @@
+from base64 import b64decode
+
 ICON_16 = "iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAAGXRFWHRTb2Z0d2FyZQBBZG9iZSBJbWFnZVJlYWR5ccllPAAAAyJpVFh0WE1MOmNvbS5hZG9iZS54bXAAAAAAADw/eHBhY2tldCBiZWdpbj0i77u/IiBpZD0iVzVNME1wQ2VoaUh6cmVTek5UY3prYzlkIj8+IDx4OnhtcG1ldGEgeG1sbnM6eD0iYWRvYmU6bnM6bWV0YS8iIHg6eG1wdGs9IkFkb2JlIFhNUCBDb3JlIDUuMy1jMDExIDY2LjE0NTY2MSwgMjAxMi8wMi8wNi0xNDo1NjoyNyAgICAgICAgIj4gPHJkZjpSREYgeG1sbnM6cmRmPSJodHRwOi8vd3d3LnczLm9yZy8xOTk5LzAyLzIyLXJkZi1zeW50YXgtbnMjIj4gPHJkZjpEZXNjcmlwdGlvbiByZGY6YWJvdXQ9IiIgeG1sbnM6eG1wPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvIiB4bWxuczp4bXBNTT0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL21tLyIgeG1sbnM6c3RSZWY9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC9zVHlwZS9SZXNvdXJjZVJlZiMiIHhtcDpDcmVhdG9yVG9vbD0iQWRvYmUgUGhvdG9zaG9wIENTNiAoV2luZG93cykiIHhtcE1NOkluc3RhbmNlSUQ9InhtcC5paWQ6NUZEMDQxM0Q5RjZCMTFFRkI4NzFFQTEwQ0RENEFEMDciIHhtcE1NOkRvY3VtZW50SUQ9InhtcC5kaWQ6NUZEMDQxM0U5RjZCMTFFRkI4NzFFQTEwQ0RENEFEMDciPiA8eG1wTU06RGVyaXZlZEZyb20gc3RSZWY6aW5zdGFuY2VJRD0ieG1wLmlpZDo1RkQwNDEzQjlGNkIxMUVGQjg3MUVBMTBDREQ0QUQwNyIgc3RSZWY6ZG9jdW1lbnRJRD0ieG1wLmRpZDo1RkQwNDEzQzlGNkIxMUVGQjg3MUVBMTBDREQ0QUQwNyIvPiA8L3JkZjpEZXNjcmlwdGlvbj4gPC9yZGY6UkRGPiA8L3g6eG1wbWV0YT4gPD94cGFja2V0IGVuZD0iciI/PstfNKMAAAMCSURBVHjanJFrSFNxGMafc87mLp4x56bbajpFp00b1RLqQxcKxYiECCQhP2RQ0aeKCgoqCgqioOgGRSAhlYZESaVJaWHDeTdtTS1vy1mb5txs23HHbf9mYLcPQf0+vby8z8PD81KIkZSkhNGYjaamZgh1WtwuKEBWVS08IgGjYmUX40lkyWjAf97qnWjgY/cC/OTX+TtxQQ4ukwGS1sXQDjsiIpl8u4Jm1KFgdKVJyC4nAsrJgPrdgGFo8Pzc90XA44VbLMaYWIjC2RAVDoW/ctF49ZReT1V8eDMtYaSgqD8SuFyT0GWaUFq2e28yOxevlEqfzgRmQ5kq+b1pNprp8oegLL/O9Z46pBxtaAv8mRqLUtMl1rtHHhB3K5l0tpLOrgrSUnGHHzdkEhtAGiAhzy12UjvQZ5NJRb9pGfOKZeb6hld1SynL+hnLNXzS7AA91YIEcx7zUZ0FLiQAv2w13CvzUJiXm6xhKfmTZ431PxwOH9x3lsRwjdjJzBUt8fY8JLa3jeTdy3OkqbuNWD8Ok2b3FLG8s5Ge9ibi83Fk27bSjQt6apE22dDT3dmvUutoX81OiPyDCBY1wtFxAYTRQ6wwwu39AvuQB4mJGmw29YHngp7lm26kfnIOBZiv/oAnRS03rWIbc/hhK6LOFoj1G+CXZSM88TLWgBSgxUhmx7BGVQ4h14aE3DKJMTs/p+p+5X1mPsa4c+zzngOndokySsB9toEeewzesBectxeEd0Im8MKcVAeaNcOnuhprzohck2HJ6KDdRc8b9PYNWeqsX97S6hSITXEIO7qQ6H4BjbEY8oQkhOOMGGHOIKI/B7U2ERH/AB5W3ers7rH1MwtlcBwfKSmyFUGagzkfC/lsKwaotRgadoQl8UpaodCAnvPiQXVl++Fjpw+dv3Rzv3ti0vHjG6I4gcTe/mg6Ov8S7j3pqDxCdKn6o4yQXZuelrpu65aC0jWrzcX4GyePn7g8r+/v6wpq9FlF+FfS9Lrcmury18bsjHz8L0qFLONf7r8JMAD+ikuBLwWDdwAAAABJRU5ErkJggg=="
 ICON_32 = "iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAAIGNIUk0AAHomAACAhAAA+gAAAIDoAAB1MAAA6mAAADqYAAAXcJy6UTwAAAAGYktHRAD/AP8A/6C9p5MAAAgZSURBVFjD3Zd7jFTVGcB/577m/d6d2SewPHZ5uLxaUJSWIJaY2hjbamutpk1jaDHQNiZNTUittbWahtbWJ1ZiE1oQgl1R0EWsDyqioLCy6OIqu8wusOwu+5jZmZ2ZO3PvPf2DJdkgIC1Jm/T75/5xz3e+3/ke5/sO/I9FXO4GL0aqvl0bCj0sCwV33rLf6ykVn7ol3dv0XwM4mJjQWxFPJAr9/eSsEl7DTYdpbtozdPKOX4HzefrK5QJkbGeXlcmiegPoqo5LEdQYntsaguXLL0Vfu1wAWzLYa2pQLGLJEEMWmFjYjhy9FP3L8sAzgbJpFUH/XRmlwKmCRb+ZJzenms7GxC/uyA7suVwAAahjaz6TK03RyuXz/YE37cq44eTTaFoeTS0hbruNSWtW3754cWP4UgDOm4Q1NTWepx598KFYrOwHZiHfWbSsQ+nU8KH+3v6WLS/8o3Vla/vCefGy7WJiXMkkuykYXkaHsrhMOL3lWSoSAfo/3LP+G99ZsRKw/h0AsXr1ndU333j9szUR32JTDTMy3Iubo6iuCI42Ccu2ndK6jcWa1o/cpkwzmisxki2Rzjm4FQ+px/6E3dDABDEs39+961ur7r63iYtUgzo+HH9c+8trbvrKNc0N6R1XqMd3MRpfAgIsS6IVD2CrtaiaW6jVFZr1+rt4TAvTtiiUHAolid8fJdcwBXPSZAqaV0yOupYKhS0tLYfTnweg/u0vj65YvHjJxqDIRj1HnkQrDVMM1qNFJlMoWKikUZwR0KvQImFGGqcz0tVPaDhHSPPgV32IWBlDS5dgJRLkLYea8phvQswzc9Pm57cC9oUAtG1bn1l75VVf/o3H49MsLYg63IYmTfRsJ3LKTXi8PoolDcVsQRgTEYoLVyREezzCwLU3kJpQR3pmAwPLllKcNx8h4IsxhUq/i1A4OmX+7IbUtu079wPyfAD+VSvv3Fw7qV6XjgMCHFcMo2s7qjRxJ2Yhg3Vks6MIZwTFPg1GLVI6WPkc8Rmz8DTOQp89k1R5FYYiWVjpJeh2kexOki/kiZdHv1RTFW9+45/v9J4PwFi29OprJtVNnazpOkJRwF+N1rcPYQ7jDB5BnXErQlEolnREoQWpVZDPO3i8HrzCpLY8jF8UqQ3qlBlwrLOdnr4+TDOPriqEQzE9EvIvevvdgxuHhobMcwFkvLzMnjt71tfD0QSKouDzh8AIILtfQzgFtFAt/gkLyKQzSDsDxeMIdx1SEaSzo9gonBoa4eOjn5LsPkbeLOJYRQxdx2XoqIpCojySmFlfF9jatOPV8VWhANa6p//6ant7W6eiqvgCYSQSZeJ14EtAKY889CRul5toeRXSNQPsAYTVhyJtwgEf6cFeLDOLZVtYtoVQVBACQ9cI+1Vi1lYS6RXMme67649r779+fPmfrQJrbuOM8NSJ8SX64SewDjyC7NyB0H2IUhaZH0R447iq5jE8MIi0swirG0ebgHRsPB4f0WAAKQQ508JjqMycNpk61+tUmWvxOwcpGfMgtEz4fLGlpZy1+VBbW2Y8gPPhkaOnli9Z8L3y9NuGc/pDhJmCwjBIGxQdu/8DRP0t2I5NLi9QrY9BSkAHYVAqFamuqsZtaMypOEJl/gG8xb1YWi3DgXvIeG7GclzEyisD0Zh36qYt25oA+yyAzGazhasXXTm9bubCK3wL70KbuwJ8FciTexGeGGRO4uh+1MQcRtJpcApoVidqKYlS/BTF7kWYSaYbj+MzX0MKN5nAStL+VVhKAsNwE4pV4NgWPp+3Ye7shr4Xd+w6MP4mdJAiddWyG74bTkwRDhpEpiHLGuGT5xC+cmTfAZy6G5FCJW9qqHYXtt6ArU0GFKxiFr/aTSnwVdKhNRS16aiaTjASRygKqYFTmIUcgWCEYiE7d8Om554Y3w2t7c27DrQfaXs/n8tSMnMUzTzS70KrdCNH+xHFEZSOJkLRcgxPFKlPQbWTOEoES59KybWQY+Jesv7vg+onGInj8YdJD/aSSQ2g6wYlM8exT1vl0Y7kPkA5tx1n97e0bkgND+A4Dqr5Af7UTzEmgFRUhCuM8skWAj4f/kAYW50M2LjECTTDg2a4z7hSCvyhGNn0ICPD/QhFJZdN0XXsiNx/4ODh3z+6ftWPfnzPasD8TDcEqne+uPG9RXNdFb7hNUhhkAk+iDy8A7VrJ6gu7KnfpFR/O8mONlSrB5UU0j0biYqUDqqqUl4xEaEoDA/2kUoNyGRXT+sLL+3683PPv9wMnAbygH3uSCaBofb2o1tm14V/4hVuRoIPYmtTUepvhWQzIJDpHrqTn9DecbzX7/MYwUBdwCOKuhBnziNK0NuTJJ8flV3He1u37Xhl3d+3Ne8EBs4avtA8AKA2Nk6fs/6xX++tn1LlKskyhKISiFSQf2UltqPQ6V9G06v79j609vFmYATI1tRUyUUL5nvr6+ti0VB4ou4yyna/tbf5QoYvBgAQ3LD+4Y3XLlv+NUPXCUYryaZPY6VP0N3dxcu7W96474E/bACSY5tnxwwUx7x4NrcKgHmhVjz+IjpXHJ/Pl1/whbm3VNZOE5nUaUpFk+MnT/DmvtaX1tz3u4eBw0D3WDzT4yAKY988UOI8LfhSRADlTZuf/qi/p1P2JNvk/t3Py3WP/HYLMBuIAx7OjPWX9bhRL/LPmdkwzVtTFb1u8HQPh9qObv3hqnt+BpwAMmOn+9yXz2UBvPnWOx3VlQlfR0f3nrt/fv99QC9nYvofufVCrr6YaJxxNZyJqcX/m/wL+Xh3Uxk4wKkAAAAldEVYdGRhdGU6Y3JlYXRlADIwMjQtMTEtMTBUMTM6NDk6MjcrMDA6MDCOlWmsAAAAJXRFWHRkYXRlOm1vZGlmeQAyMDI0LTExLTEwVDEzOjQ5OjI3KzAwOjAw/8jREAAAACh0RVh0ZGF0ZTp0aW1lc3RhbXAAMjAyNC0xMS0xMFQxMzo0OToyOCswMDowMF6VgCYAAAAASUVORK5CYII="
+
+# Decoded PNG data, built once at import time
+ICON_16_BYTES = b64decode(ICON_16)
+ICON_32_BYTES = b64decode(ICON_32)
@@ -14,20 +14,29 @@ import customtkinter as ctk
 import tkintermapview as tkmap
 # pip install requests
 import requests
-from requests import get
+from requests.adapters import HTTPAdapter
+# pip install requests-cache
+import requests_cache
+# pip install msgspec
+import msgspec
+# pip install platformdirs
+from platformdirs import user_cache_dir
 # pip install pillow
 from PIL import ImageTk
 # pip install tkinter-tooltip
 from tktooltip import ToolTip
-from base64 import b64decode
-from time import sleep
-from datetime import datetime
-from threading import Thread
+import os
+import logging
+from random import random
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 from wmo_codes import get_wmo_weather_description
-from iss_icon import ICON_16
-from iss_icon import ICON_32
+from iss_icon import ICON_16_BYTES
+from iss_icon import ICON_32_BYTES
 from ctk_horizontal_spinbox import CTkHorizontalSpinbox
 
+logger = logging.getLogger("iss")
+
 # https://wheretheiss.at/w/developer
 URL = "https://api.wheretheiss.at/v1/satellites/25544?units=miles"
 
@@ -35,6 +44,46 @@ BIG_GAP = 40
 SMALL_GAP = 10
 TINY_GAP = 0
 
+# Map tile cache in the per-user cache folder, so it survives restarts
+# of the one file build, which unpacks to a temporary folder
+TILE_CACHE = os.path.join(
+    user_cache_dir("ISSTracker", appauthor=False), "tile_cache"
+)
+
+# Smallest change in degrees worth redrawing the marker for
+MIN_MOVE = 0.001
+
+# Longest wait in seconds between retries while the API is failing
+MAX_BACKOFF = 300
+
+
+class ISSPosition(msgspec.Struct):
+    """The fields used from the ISS API response, other keys are skipped."""
+    latitude: float
+    longitude: float
+
+
+# Typed JSON decoder for the ISS API response
+POSITION_DECODER = msgspec.json.Decoder(ISSPosition)
+
+
+class CachedTileRequests:
+    """Stand-in for the requests module used by TkinterMapView.
+
+    Tile downloads go through a disk-backed cache so tiles are reused
+    across map changes and restarts. Everything else, like
+    requests.exceptions, falls through to the real requests module.
+    """
+
+    def __init__(self, session):
+        self.session = session
+
+    def __getattr__(self, name):
+        return getattr(requests, name)
+
+    def get(self, *args, **kwargs):
+        return self.session.get(*args, **kwargs)
+
 
 class ISSTracker:
     """Class to track and display the International Space Station's position on a map."""
@@ -65,8 +114,8 @@ class ISSTracker:
         self.root.geometry("+50+50")
 
         # Set the window and taskbar icon
-        small_icon = ImageTk.PhotoImage(data=b64decode(ICON_16))
-        large_icon = ImageTk.PhotoImage(data=b64decode(ICON_32))
+        small_icon = ImageTk.PhotoImage(data=ICON_16_BYTES)
+        large_icon = ImageTk.PhotoImage(data=ICON_32_BYTES)
         self.root.wm_iconbitmap()
         self.root.iconphoto(False, large_icon, small_icon)
 
@@ -77,20 +126,94 @@ class ISSTracker:
         # Initialize the ISS position and update interval
         self.update_interval = update_interval
         self.running = False
-        self.update_thread = None
-        self.count = 0
+        self.after_id = None
+        # Seconds to wait before retrying after a failed update
+        self.backoff = update_interval
+
+        # Single worker thread for the blocking HTTP requests,
+        # all widget updates stay on the main Tk thread
+        self.executor = ThreadPoolExecutor(max_workers=1)
 
         # LIst to track previous positions for drawing lines
         self.previous_positions = []
 
+        # Reuse one HTTP session for every API poll so the keep-alive
+        # connections to the ISS and weather APIs are not rebuilt each update.
+        # The API position only changes about once a second, so ISS
+        # responses are cached in memory for one second to skip redundant
+        # requests. Weather URLs change with every position, so they are
+        # never cached or the memory cache would grow without limit
+        self.session = requests_cache.CachedSession(
+            "iss_cache",
+            backend="memory",
+            expire_after=1,
+            urls_expire_after={
+                "api.open-meteo.com": requests_cache.DO_NOT_CACHE
+            }
+        )
+        self.session.mount(
+            "https://", HTTPAdapter(pool_connections=2, pool_maxsize=2)
+        )
+        self.session.headers.update(
+            {
+                "Connection": "keep-alive",
+                "User-Agent": "ISSTracker/1.0",
+                "Accept": "application/json"
+            }
+        )
+
+        # TkinterMapView downloads tiles with requests.get, point it at a
+        # SQLite cache so tiles are not downloaded again for a week.
+        # The cache is optional, the app runs without it if it fails
+        try:
+            os.makedirs(os.path.dirname(TILE_CACHE), exist_ok=True)
+            self.tile_session = requests_cache.CachedSession(
+                TILE_CACHE,
+                backend="sqlite",
+                expire_after=timedelta(days=7)
+            )
+            # Remove tiles that have expired since the last run
+            self.tile_session.cache.delete(expired=True)
+        except Exception:
+            logger.exception("Error opening map tile cache")
+            self.tile_session = None
+        else:
+            tkmap.map_widget.requests = CachedTileRequests(self.tile_session)
+
         self.marker = None
-        self.get_iss_position()
+        # Last position the marker was drawn at
+        self.last_lat = None
+        self.last_lng = None
+
+        # Start the first position request in the worker so the
+        # connection setup overlaps with building the widgets
+        position = self.executor.submit(self.get_iss_position)
 
         # Create the main application widgets
         self.create_widgets()
 
-        # Initialize marker with current ISS position
-        self.initialize_marker()
+        # Wait for the first ISS position
+        try:
+            self.lat, self.lng = position.result(timeout=5)
+        except Exception:
+            # Start without a marker or position, the first successful
+            # poll creates the marker
+            logger.exception("Error getting initial ISS position")
+            self.lat, self.lng = None, None
+            self.bootstrap = None
+        else:
+            # Get the weather for this position in the background,
+            # the first poll shows it instead of fetching again
+            self.bootstrap = self.executor.submit(
+                self.fetch_weather_update, self.lat, self.lng
+            )
+
+            # Show the first position
+            self.map.set_position(self.lat, self.lng)
+            self.display_position()
+
+            # Initialize marker with current ISS position
+            self.initialize_marker()
 
 # -------------------------INITIALIZE MARKER ----------------------------- #
     def initialize_marker(self):
@@ -106,66 +229,143 @@ class ISSTracker:
             )
             # Add initial position to previous positions
             self.previous_positions.append((self.lat, self.lng))
+            self.last_lat, self.last_lng = self.lat, self.lng
 
-        except Exception as e:
-            print(f"Error initializing marker: {e}")
-            # Fall back to 0,0 if we can't get initial position
-            self.marker = self.map.set_marker(
-                0,
-                0,
-                text="ISS",
-                marker_color_circle="red",
-                marker_color_outside="darkblue"
-            )
-            self.previous_positions.append((0, 0))
+        except Exception:
+            # Leave the marker unset, update_marker_position creates it
+            logger.exception("Error initializing marker")
 
 # ------------------------- GET ISS POSITION ---------------------------- #
     def get_iss_position(self):
-        """Fetch the current ISS position from API."""
+        """Fetch the current ISS position from API.
+
+        Returns:
+            tuple: The (latitude, longitude) of the ISS
+        """
         # Get the current ISS position from the API
-        response = get(URL)
+        response = self.session.get(URL, timeout=5)
 
         # Check for HTTP errors
         response.raise_for_status()
 
-        # Parse the JSON response to a Python dictionary
-        position = response.json()
+        # Decode the JSON response straight to an ISSPosition
+        position = POSITION_DECODER.decode(response.content)
+        return position.latitude, position.longitude
+
+# ------------------------- POLL ----------------------------------------- #
+    def poll(self):
+        """Fetch the ISS position and weather in the worker thread."""
+        if not self.running:
+            return
+
+        # Apply the update fetched at startup on the first poll
+        if self.bootstrap is not None:
+            future, self.bootstrap = self.bootstrap, None
+            future.add_done_callback(self.fetch_done)
+            return
+
+        future = self.executor.submit(self.fetch_update)
+
+        # Hand the result back to the main thread when the fetch is done
+        future.add_done_callback(self.fetch_done)
+
+# ------------------------- FETCH DONE ----------------------------------- #
+    def fetch_done(self, future):
+        """Queue apply_update on the Tk event loop from the worker thread."""
+        # The window may have been closed while the request was in flight
+        if self.running:
+            self.root.after(0, self.apply_update, future)
+
+# ------------------------- FETCH UPDATE --------------------------------- #
+    def fetch_update(self):
+        """Get the ISS position and the weather below it.
+
+        Runs in the worker thread, so no widgets or tracker state are
+        touched here. Everything the GUI needs is returned in one dict
+        so apply_update can make all widget changes in a single callback.
+        """
+        lat, lng = self.get_iss_position()
+        return self.fetch_weather_update(lat, lng)
 
-        # Extract the latitude and longitude from the response
-        self.lat = float(position.get("latitude"))
-        self.lng = float(position.get("longitude"))
+# ------------------------- FETCH WEATHER UPDATE ------------------------- #
+    def fetch_weather_update(self, lat, lng):
+        """Get the weather for an ISS position and build the update dict.
 
-# -------------------- UPDATE ISS POSITION THREAD ------------------------ #
-    def update_iss_position_thread(self):
-        """Update the ISS marker position on the map."""
-        while self.running:
-            try:
-                self.get_iss_position()
-                # Update the position count
-                self.count += 1
-                self.lbl_count.configure(text=f" Count: {self.count} ")
-                self.lbl_lat.configure(text=f" Latitude: {self.lat:.4f} ")
-                self.lbl_lng.configure(
-                    text=f" Longitude: {self.lng:.4f} "
-                )
+        A weather failure does not throw away the ISS position, the
+        weather is None instead.
+        """
+        try:
+            weather = self.get_weather(lat, lng)
+        except Exception:
+            logger.exception("Error getting weather")
+            weather = None
+        return {
+            "lat": lat,
+            "lng": lng,
+            "weather": weather
+        }
 
-                # Get the current weather
-                self.get_weather()
+# ------------------------- APPLY UPDATE --------------------------------- #
+    def apply_update(self, future):
+        """Update the GUI with a finished fetch and schedule the next poll.
 
-                # Schedule GUI update on the main thread
-                # This will keep the GUI responsive while updating the marker
-                self.root.after(0, self.update_marker_position)
+        Args:
+            future (Future): The completed fetch_update call
+        """
+        if not self.running:
+            return
 
-                # Sleep the thread for the update interval before the next update
-                sleep(self.update_interval)
+        try:
+            data = future.result()
+        except Exception:
+            logger.exception("Error updating ISS position")
+
+            # Back off exponentially with jitter while the ISS API is failing.
+            # Weather errors are handled in fetch_update and never get here
+            delay = self.backoff + random()
+            self.backoff = min(self.backoff * 2, MAX_BACKOFF)
+        else:
+            delay = self.update_interval
+            self.backoff = self.update_interval
+            self.lat, self.lng = data["lat"], data["lng"]
 
-            except Exception as e:
-                print(f"Error updating ISS position: {e}")
+            # A display error must not stop the polling below
+            try:
+                # Update the position count, Tk converts it to text when drawn
+                self.count_var.set(self.count_var.get() + 1)
+                self.display_position()
+                self.display_weather(data["weather"])
+                self.update_marker_position()
+            except Exception:
+                logger.exception("Error displaying ISS position")
+
+        # Schedule the next poll
+        self.after_id = self.root.after(int(delay * 1000), self.poll)
+
+# ------------------------- DISPLAY POSITION ----------------------------- #
+    def display_position(self) -> None:
+        """Show the current ISS position in the latitude/longitude labels."""
+        self.set_label_text(self.lat_var, f" Latitude: {self.lat:.4f} ")
+        self.set_label_text(self.lng_var, f" Longitude: {self.lng:.4f} ")
+
+# ------------------------- SET LABEL TEXT ------------------------------- #
+    @staticmethod
+    def set_label_text(var, text: str) -> None:
+        """Set a label's StringVar only if the text has changed."""
+        if var.get() != text:
+            var.set(text)
 
 # --------------------- UPDATE MARKER POSITION --------------------------- #
     def update_marker_position(self) -> None:
         """Update the marker and map position in the GUI thread."""
         if self.marker:
+            # Skip the redraw if the ISS has not moved a visible amount
+            if (
+                abs(self.lat - self.last_lat) < MIN_MOVE
+                and abs(self.lng - self.last_lng) < MIN_MOVE
+            ):
+                return
+
             # Draw line from previous position
             if self.previous_positions:
                 last_pos = self.previous_positions[-1]
@@ -178,14 +378,18 @@ class ISSTracker:
                     width=3                  # Line width
                 )
 
-            # Update marker and map position
+            # Update marker position
             self.marker.set_position(self.lat, self.lng)
-            self.map.set_position(self.lat, self.lng)
+
+            # Only re-center the map when the ISS leaves the visible area
+            if not self.marker_in_view():
+                self.map.set_position(self.lat, self.lng)
 
             # Add new position to tracking list
             self.previous_positions.append((self.lat, self.lng))
 
         else:
+            # First known position, create the marker without a path line
             self.marker = self.map.set_marker(
                 self.lat,
                 self.lng,
@@ -193,8 +397,20 @@ class ISSTracker:
                 marker_color_circle="red",
                 marker_color_outside="red"
             )
+            self.map.set_position(self.lat, self.lng)
             self.previous_positions.append((self.lat, self.lng))
 
+        self.last_lat, self.last_lng = self.lat, self.lng
+
+# ------------------------- MARKER IN VIEW ------------------------------- #
+    def marker_in_view(self) -> bool:
+        """Check if the current ISS position is inside the visible map."""
+        # Convert the position to tile coordinates at the current zoom
+        x, y = tkmap.decimal_to_osm(self.lat, self.lng, round(self.map.zoom))
+        left, top = self.map.upper_left_tile_pos
+        right, bottom = self.map.lower_right_tile_pos
+        return left <= x <= right and top <= y <= bottom
+
 # ------------------------- CHANGE MAP ----------------------------------- #
     def change_map(self, new_map: str) -> None:
         """Change the map tile server based on the selected option."""
@@ -244,15 +460,18 @@ class ISSTracker:
             else:
                 raise ValueError("Interval must be a positive integer")
         except ValueError:
-            print("Invalid update interval. Please enter a positive number.")
-        except Exception as e:
-            print(f"Error changing update interval: {e}")
+            logger.warning(
+                "Invalid update interval. Please enter a positive number."
+            )
+        except Exception:
+            logger.exception("Error changing update interval")
 
 # ------------------------- GET WEATHER ---------------------------------- #
-    def get_weather(self):
+    def get_weather(self, lat, lng):
+        """Fetch the current weather at the ISS position."""
         params = {
-            "latitude": f"{self.lat}",
-            "longitude": f"{self.lng}",
+            "latitude": f"{lat}",
+            "longitude": f"{lng}",
             "hourly": [
                 "temperature_2m",
                 "relativehumidity_2m",
@@ -271,12 +490,13 @@ class ISSTracker:
         # URL to access current Open-Meteo weather for a location
         URL = "https://api.open-meteo.com/v1/forecast?"
         # Get the API JSON data as a Python requests object
-        response = requests.get(
+        response = self.session.get(
             URL,
-            params=params
+            params=params,
+            timeout=5
         )
 
-        data = response.json()
+        data = msgspec.json.decode(response.content)
 
         # Get current hour
         current_hour = datetime.now().hour
@@ -306,27 +526,41 @@ class ISSTracker:
         #  console.print(f"     Temp: [bold cyan]{c_data[0]}°F[/bold cyan]")
         # console.print(f" Humidity: [bold cyan]{c_data[1]}%[/bold cyan]")
         # console.print(f"  Wind Sp: [bold cyan]{c_data[2]} mph[/bold cyan]")
-        self.lbl_description.configure(text=f"{description}")
-        self.lbl_display_temp.configure(text=f"{temp}°F")
-        self.lbl_display_humidity.configure(text=f"{humidity}%")
-        self.lbl_display_wind.configure(text=f"{wind_speed} mph")
-        self.lbl_display_pressure.configure(text=f"{pressure} inHg")
-        self.lbl_display_cloud_cover.configure(text=f"{cloud_cover}%")
-        self.lbl_display_day.configure(text=f"{day}")
+        return {
+            "description": description,
+            "temp": temp,
+            "humidity": humidity,
+            "wind_speed": wind_speed,
+            "pressure": pressure,
+            "cloud_cover": cloud_cover,
+            "day": day
+        }
+
+# ------------------------- DISPLAY WEATHER ------------------------------ #
+    def display_weather(self, weather):
+        """Show the weather returned by get_weather in the status labels."""
+        # Keep the last weather shown if this update could not get any
+        if weather is None:
+            return
+        self.lbl_description.configure(text=f"{weather['description']}")
+        self.lbl_display_temp.configure(text=f"{weather['temp']}°F")
+        self.lbl_display_humidity.configure(text=f"{weather['humidity']}%")
+        self.lbl_display_wind.configure(text=f"{weather['wind_speed']} mph")
+        self.lbl_display_pressure.configure(
+            text=f"{weather['pressure']} inHg"
+        )
+        self.lbl_display_cloud_cover.configure(
+            text=f"{weather['cloud_cover']}%"
+        )
+        self.lbl_display_day.configure(text=f"{weather['day']}")
 
 # ------------------------- RUN ------------------------------------------ #
     def run(self):
         """Start the ISS tracker application."""
         self.running = True
 
-        # Create the thread to update the ISS position
-        self.update_thread = Thread(
-            target=self.update_iss_position_thread,
-            daemon=True     # This stops the thread on program exit
-        )
-
-        # Start the thread
-        self.update_thread.start()
+        # Start polling the ISS position once the event loop is running
+        self.after_id = self.root.after(0, self.poll)
 
         # Start the main event loop of the program
         self.root.mainloop()
@@ -349,7 +583,6 @@ class ISSTracker:
             height=self.height,
             corner_radius=2
         )
-        self.map.set_position(self.lat, self.lng)
         self.map.set_zoom(5)
         self.map.pack(expand=True, fill="both")
 
@@ -360,22 +593,35 @@ class ISSTracker:
             pady=(10), sticky="nsew"
         )
 
+        # Variables bound to the position and count labels
+        self.lat_var = ctk.StringVar()
+        self.lng_var = ctk.StringVar()
+        self.count_var = ctk.IntVar(value=0)
+
         # Create labels with CustomTkinter styling
         self.lbl_lat = ctk.CTkLabel(
             self.status_frame,
-            text=f"Latitude: {self.lat:.4f}",
+            textvariable=self.lat_var,
             corner_radius=6,
             fg_color=("gray85", "gray25")
         )
         self.lbl_lng = ctk.CTkLabel(
             self.status_frame,
-            text=f"Longitude: {self.lng:.4f}",
+            textvariable=self.lng_var,
             corner_radius=6,
             fg_color=("gray85", "gray25")
         )
         self.lbl_count = ctk.CTkLabel(
             self.status_frame,
-            text="Count: 0",
+            text="Count:",
+            anchor="e",
+            corner_radius=6,
+            fg_color=("gray85", "gray25")
+        )
+        self.lbl_display_count = ctk.CTkLabel(
+            self.status_frame,
+            textvariable=self.count_var,
+            anchor="w",
             corner_radius=6,
             fg_color=("gray85", "gray25")
         )
@@ -434,7 +680,10 @@ class ISSTracker:
             row=3, column=0, columnspan=2, padx=10, pady=10, sticky="ew"
         )
         self.lbl_count.grid(
-            row=4, column=0, columnspan=2, padx=10, pady=(10, 40), sticky="ew"
+            row=4, column=0, padx=(10, 0), pady=(10, 40), sticky="ew"
+        )
+        self.lbl_display_count.grid(
+            row=4, column=1, padx=(0, 10), pady=(10, 40), sticky="ew"
         )
 
         self.lbl_tile_server.grid(
@@ -571,12 +820,27 @@ class ISSTracker:
     def quit(self, *arts):
         """Stop the ISS tracker application."""
         self.running = False
+        # Stop the next scheduled poll and any fetch still waiting to run
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        # Drop pending tile downloads and stop the map's loader threads
+        # before closing the tile cache they download through
+        self.map.image_load_queue_tasks.clear()
+        self.map.destroy()
+        # Release the pooled HTTP connections
+        self.session.close()
+        if self.tile_session is not None:
+            # Give TkinterMapView back the real requests module
+            tkmap.map_widget.requests = requests
+            self.tile_session.close()
         # Closes the main application window by destroying the root window
         self.root.destroy()
 
 
 def main():
     """Create and run the ISS tracker application."""
+    logging.basicConfig(level=logging.WARNING)
     tracker = ISSTracker()
     tracker.run()
 